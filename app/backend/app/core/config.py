@@ -13,6 +13,12 @@ class Settings(BaseSettings):
     # Database
     DATABASE_URL: str = "sqlite:///./app.db"
 
+    # SQLite tuning (PRAGMAs aplicados en cada conexión del pool)
+    SQLITE_PRAGMA_PROFILE: str = "performance"  # performance, durable, none
+    SQLITE_MMAP_SIZE: int = 256 * 1024 * 1024  # bytes
+    SQLITE_CACHE_SIZE: int = -64000  # negativo = KiB (64 MB)
+    SQLITE_BUSY_TIMEOUT_MS: int = 5000
+
     # JWT
     SECRET_KEY: str = os.getenv("SECRET_KEY", "your-secret-key-change-in-production")
     ALGORITHM: str = "HS256"
@@ -1,30 +1,129 @@
 from pathlib import Path
-from sqlalchemy import create_engine, text
-from sqlalchemy.orm import sessionmaker, Session
+from typing import AsyncIterator, Optional, Union
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.engine import Connection, Engine, make_url
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 from app.core.config import settings
 
 # Importar todos los modelos para registrarlos con Base
 from app.models.user import Base
 
+
+def to_async_url(url: str) -> str:
+    """Convertir una URL de SQLite síncrona a su driver asíncrono (aiosqlite)."""
+    parsed = make_url(url)
+    if parsed.drivername == "sqlite":
+        parsed = parsed.set(drivername="sqlite+aiosqlite")
+    return parsed.render_as_string(hide_password=False)
+
+
 # Configurar la base de datos SQLite
 SQLALCHEMY_DATABASE_URL = settings.DATABASE_URL
+SQLALCHEMY_ASYNC_DATABASE_URL = to_async_url(SQLALCHEMY_DATABASE_URL)
+
+# Perfiles de PRAGMAs para SQLite. Se aplican en cada conexión nueva del pool,
+# ya que la mayoría de PRAGMAs son por conexión (journal_mode=WAL persiste en el
+# fichero, pero reaplicarlo es inocuo).
+SQLITE_PRAGMA_PROFILES = {
+    # Lectores concurrentes con un escritor, fsync solo en checkpoints de WAL
+    "performance": {
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "mmap_size": settings.SQLITE_MMAP_SIZE,
+        "cache_size": settings.SQLITE_CACHE_SIZE,
+        "temp_store": "MEMORY",
+        "busy_timeout": settings.SQLITE_BUSY_TIMEOUT_MS,
+        "foreign_keys": "ON",
+    },
+    # Igual que performance pero con fsync en cada commit
+    "durable": {
+        "journal_mode": "WAL",
+        "synchronous": "FULL",
+        "cache_size": settings.SQLITE_CACHE_SIZE,
+        "temp_store": "MEMORY",
+        "busy_timeout": settings.SQLITE_BUSY_TIMEOUT_MS,
+        "foreign_keys": "ON",
+    },
+    # Valores por defecto de SQLite
+    "none": {},
+}
 
-# Para SQLite en desarrollo, usar StaticPool para evitar problemas con threading
-engine = create_engine(
-    SQLALCHEMY_DATABASE_URL,
-    connect_args={"check_same_thread": False},
-)
 
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+def get_sqlite_profile(name: Optional[str] = None) -> dict:
+    """Obtener los PRAGMAs de un perfil por nombre."""
+    name = name or settings.SQLITE_PRAGMA_PROFILE
+    if name not in SQLITE_PRAGMA_PROFILES:
+        raise ValueError(f"Perfil de SQLite desconocido: '{name}'")
+    return SQLITE_PRAGMA_PROFILES[name]
 
 
-def get_db() -> Session:
-    """Obtener sesión de base de datos."""
-    db = SessionLocal()
+def apply_sqlite_pragmas(dbapi_connection, pragmas: dict) -> None:
+    """Aplicar PRAGMAs sobre una conexión DBAPI de SQLite."""
+    cursor = dbapi_connection.cursor()
     try:
-        yield db
+        for pragma, value in pragmas.items():
+            cursor.execute(f"PRAGMA {pragma}={value}")
     finally:
-        db.close()
+        cursor.close()
+
+
+def configure_sqlite_engine(
+    engine: Union[Engine, AsyncEngine], profile: Optional[str] = None
+) -> Union[Engine, AsyncEngine]:
+    """Registrar el perfil de PRAGMAs en todas las conexiones del engine."""
+    if engine.dialect.name != "sqlite":
+        return engine
+
+    pragmas = get_sqlite_profile(profile)
+
+    # Los engines asíncronos exponen los eventos de pool en su sync_engine
+    @event.listens_for(getattr(engine, "sync_engine", engine), "connect")
+    def _set_sqlite_pragmas(dbapi_connection, connection_record):
+        apply_sqlite_pragmas(dbapi_connection, pragmas)
+
+    return engine
+
+
+def read_sqlite_pragmas(connection: Connection, pragmas) -> dict:
+    """Leer los valores efectivos de los PRAGMAs en una conexión."""
+    return {
+        pragma: connection.execute(text(f"PRAGMA {pragma}")).scalar()
+        for pragma in pragmas
+    }
+
+
+# Engine síncrono: solo para init_db y migraciones
+engine = configure_sqlite_engine(
+    create_engine(
+        SQLALCHEMY_DATABASE_URL,
+        connect_args={"check_same_thread": False},
+    )
+)
+
+# Engine asíncrono (aiosqlite) para el camino de las requests
+async_engine = configure_sqlite_engine(
+    create_async_engine(
+        SQLALCHEMY_ASYNC_DATABASE_URL,
+        connect_args={"check_same_thread": False},
+    )
+)
+
+# expire_on_commit=False: en async no se puede hacer lazy load implícito
+# de atributos expirados tras un commit
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine, autoflush=False, expire_on_commit=False
+)
+
+
+async def get_db() -> AsyncIterator[AsyncSession]:
+    """Obtener sesión asíncrona de base de datos."""
+    async with AsyncSessionLocal() as db:
+        yield db
 
 
 def init_db() -> None:
@@ -59,3 +158,8 @@ def init_db() -> None:
 def get_engine():
     """Obtener engine de SQLAlchemy."""
     return engine
+
+
+def get_async_engine() -> AsyncEngine:
+    """Obtener engine asíncrono de SQLAlchemy."""
+    return async_engine
@@ -1,5 +1,5 @@
 from fastapi import Depends, HTTPException, status, Request
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from app.core.database import get_db
 from app.core.security import verify_token
 from app.repositories.user import UserRepository
@@ -7,7 +7,7 @@ from app.schemas.user import UserResponse
 
 
 async def get_current_user(
-    request: Request, db: Session = Depends(get_db)
+    request: Request, db: AsyncSession = Depends(get_db)
 ) -> UserResponse:
     """Obtener usuario actual desde el token JWT en el header Authorization."""
     auth_header = request.headers.get("Authorization")
@@ -45,7 +45,7 @@ async def get_current_user(
         )
 
     # Obtener usuario de la base de datos
-    user = UserRepository.get_user_by_id(db, user_id)
+    user = await UserRepository.get_user_by_id(db, user_id)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED, detail="User not found"
@@ -1,11 +1,11 @@
 from fastapi import Request, HTTPException, status
 from app.services.idempotency import IdempotencyService
 from app.schemas.user import UserResponse
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 
 async def check_idempotency(
-    request: Request, user: UserResponse, db: Session, body: dict
+    request: Request, user: UserResponse, db: AsyncSession, body: dict
 ) -> dict:
     """
     Verificar y gestionar idempotencia para requests.
@@ -28,7 +28,7 @@ async def check_idempotency(
         )
 
     # Buscar respuesta cacheada
-    cached = IdempotencyService.get_cached_response(db, user.id, idempotency_key)
+    cached = await IdempotencyService.get_cached_response(db, user.id, idempotency_key)
 
     if cached:
         # Retornar respuesta cacheada
@@ -37,16 +37,16 @@ async def check_idempotency(
     return None
 
 
-def cache_response(
+async def cache_response(
     user: UserResponse,
-    db: Session,
+    db: AsyncSession,
     idempotency_key: str,
     request_hash: str,
     response_data: dict,
     status_code: int,
 ):
     """Cachear respuesta para operación idempotente."""
-    IdempotencyService.cache_response(
+    await IdempotencyService.cache_response(
         db=db,
         user_id=user.id,
         idempotency_key=idempotency_key,
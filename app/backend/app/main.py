@@ -2,7 +2,13 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from datetime import datetime
 from app.core.config import settings
-from app.core.database import init_db, get_engine
+from sqlalchemy import text
+from app.core.database import (
+    init_db,
+    get_async_engine,
+    get_sqlite_profile,
+    read_sqlite_pragmas,
+)
 from app.routers import auth, tasks, categories
 
 # Inicializar base de datos
@@ -40,15 +46,26 @@ def health_check():
 
 
 @app.get("/ready")
-def readiness_check():
+async def readiness_check():
     """Readiness check endpoint."""
     try:
-        engine = get_engine()
-        with engine.connect() as conn:
-            conn.execute("SELECT 1")
+        engine = get_async_engine()
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+            checks = {"database": "ok"}
+
+            # Perfil de PRAGMAs activo y sus valores efectivos
+            if engine.dialect.name == "sqlite":
+                profile = settings.SQLITE_PRAGMA_PROFILE
+                checks["sqlite_profile"] = {
+                    "name": profile,
+                    "pragmas": await conn.run_sync(
+                        read_sqlite_pragmas, get_sqlite_profile(profile)
+                    ),
+                }
         return {
             "status": "ready",
-            "checks": {"database": "ok"},
+            "checks": checks,
             "timestamp": datetime.utcnow().isoformat(),
         }
     except Exception as e:
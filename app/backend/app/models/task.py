@@ -39,7 +39,10 @@ class Task(Base):
         DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False
     )
 
-    categories = relationship("Category", secondary="task_categories", backref="tasks")
+    # selectin: una sola query extra por lote de tareas (sin lazy load en async)
+    categories = relationship(
+        "Category", secondary="task_categories", backref="tasks", lazy="selectin"
+    )
 
     # Índices
     __table_args__ = (
@@ -1,4 +1,5 @@
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from app.models.task import Category, TaskCategory
 from datetime import datetime
 from typing import Optional, List
@@ -8,53 +9,50 @@ class CategoryRepository:
     """Repositorio para operaciones de categorías."""
 
     @staticmethod
-    def create_category(
-        db: Session, user_id: int, name: str, color: Optional[str] = None
+    async def create_category(
+        db: AsyncSession, user_id: int, name: str, color: Optional[str] = None
     ) -> Category:
         """Crear nueva categoría."""
         category = Category(user_id=user_id, name=name, color=color)
         db.add(category)
-        db.commit()
-        db.refresh(category)
+        await db.commit()
+        await db.refresh(category)
         return category
 
     @staticmethod
-    def get_category_by_id(
-        db: Session, category_id: int, user_id: int
+    async def get_category_by_id(
+        db: AsyncSession, category_id: int, user_id: int
     ) -> Optional[Category]:
         """Obtener categoría por ID (solo si pertenece al usuario)."""
-        return (
-            db.query(Category)
-            .filter(Category.id == category_id, Category.user_id == user_id)
-            .first()
+        result = await db.execute(
+            select(Category).where(
+                Category.id == category_id, Category.user_id == user_id
+            )
         )
+        return result.scalars().first()
 
     @staticmethod
-    def get_categories_by_user(db: Session, user_id: int) -> List[Category]:
+    async def get_categories_by_user(db: AsyncSession, user_id: int) -> List[Category]:
         """Obtener todas las categorías del usuario."""
-        return db.query(Category).filter(Category.user_id == user_id).all()
+        result = await db.execute(select(Category).where(Category.user_id == user_id))
+        return list(result.scalars().all())
 
     @staticmethod
-    def get_category_by_name(
-        db: Session, user_id: int, name: str
+    async def get_category_by_name(
+        db: AsyncSession, user_id: int, name: str
     ) -> Optional[Category]:
         """Obtener categoría por nombre (para evitar duplicados)."""
-        return (
-            db.query(Category)
-            .filter(Category.user_id == user_id, Category.name == name)
-            .first()
+        result = await db.execute(
+            select(Category).where(Category.user_id == user_id, Category.name == name)
         )
+        return result.scalars().first()
 
     @staticmethod
-    def update_category(
-        db: Session, category_id: int, user_id: int, **kwargs
+    async def update_category(
+        db: AsyncSession, category_id: int, user_id: int, **kwargs
     ) -> Optional[Category]:
         """Actualizar categoría."""
-        category = (
-            db.query(Category)
-            .filter(Category.id == category_id, Category.user_id == user_id)
-            .first()
-        )
+        category = await CategoryRepository.get_category_by_id(db, category_id, user_id)
 
         if not category:
             return None
@@ -66,25 +64,21 @@ class CategoryRepository:
 
         category.updated_at = datetime.utcnow()
 
-        db.commit()
-        db.refresh(category)
+        await db.commit()
+        await db.refresh(category)
         return category
 
     @staticmethod
-    def delete_category(db: Session, category_id: int, user_id: int) -> bool:
+    async def delete_category(db: AsyncSession, category_id: int, user_id: int) -> bool:
         """Eliminar categoría (y sus asociaciones)."""
-        category = (
-            db.query(Category)
-            .filter(Category.id == category_id, Category.user_id == user_id)
-            .first()
-        )
+        category = await CategoryRepository.get_category_by_id(db, category_id, user_id)
 
         if not category:
             return False
 
         # Las asociaciones se eliminarán automáticamente por CASCADE
-        db.delete(category)
-        db.commit()
+        await db.delete(category)
+        await db.commit()
         return True
 
 
@@ -92,17 +86,25 @@ class TaskCategoryRepository:
     """Repositorio para relaciones Task-Category."""
 
     @staticmethod
-    def add_category_to_task(
-        db: Session, task_id: int, category_id: int
+    async def get_task_category(
+        db: AsyncSession, task_id: int, category_id: int
+    ) -> Optional[TaskCategory]:
+        """Obtener relación Task-Category si existe."""
+        result = await db.execute(
+            select(TaskCategory).where(
+                TaskCategory.task_id == task_id, TaskCategory.category_id == category_id
+            )
+        )
+        return result.scalars().first()
+
+    @staticmethod
+    async def add_category_to_task(
+        db: AsyncSession, task_id: int, category_id: int
     ) -> TaskCategory:
         """Agregar categoría a tarea."""
         # Verificar si ya existe
-        existing = (
-            db.query(TaskCategory)
-            .filter(
-                TaskCategory.task_id == task_id, TaskCategory.category_id == category_id
-            )
-            .first()
+        existing = await TaskCategoryRepository.get_task_category(
+            db, task_id, category_id
         )
 
         if existing:
@@ -110,46 +112,44 @@ class TaskCategoryRepository:
 
         task_category = TaskCategory(task_id=task_id, category_id=category_id)
         db.add(task_category)
-        db.commit()
-        db.refresh(task_category)
+        await db.commit()
+        await db.refresh(task_category)
         return task_category
 
     @staticmethod
-    def remove_category_from_task(db: Session, task_id: int, category_id: int) -> bool:
+    async def remove_category_from_task(
+        db: AsyncSession, task_id: int, category_id: int
+    ) -> bool:
         """Remover categoría de tarea."""
-        task_category = (
-            db.query(TaskCategory)
-            .filter(
-                TaskCategory.task_id == task_id, TaskCategory.category_id == category_id
-            )
-            .first()
+        task_category = await TaskCategoryRepository.get_task_category(
+            db, task_id, category_id
         )
 
         if not task_category:
             return False
 
-        db.delete(task_category)
-        db.commit()
+        await db.delete(task_category)
+        await db.commit()
         return True
 
     @staticmethod
-    def get_task_categories(db: Session, task_id: int) -> List[Category]:
+    async def get_task_categories(db: AsyncSession, task_id: int) -> List[Category]:
         """Obtener todas las categorías de una tarea."""
-        return (
-            db.query(Category)
+        result = await db.execute(
+            select(Category)
             .join(TaskCategory, Category.id == TaskCategory.category_id)
-            .filter(TaskCategory.task_id == task_id)
-            .all()
+            .where(TaskCategory.task_id == task_id)
         )
+        return list(result.scalars().all())
 
     @staticmethod
-    def get_category_tasks(db: Session, category_id: int) -> List:
+    async def get_category_tasks(db: AsyncSession, category_id: int) -> List:
         """Obtener todas las tareas de una categoría."""
         from app.models.task import Task
 
-        return (
-            db.query(Task)
+        result = await db.execute(
+            select(Task)
             .join(TaskCategory, Task.id == TaskCategory.task_id)
-            .filter(TaskCategory.category_id == category_id)
-            .all()
+            .where(TaskCategory.category_id == category_id)
         )
+        return list(result.scalars().all())
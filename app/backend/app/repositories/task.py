@@ -1,5 +1,5 @@
-from sqlalchemy.orm import Session
-from sqlalchemy import and_, or_
+from sqlalchemy import and_, func, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
 from app.models.task import Task, TaskEvent, TaskCategory, Category
 from datetime import datetime
 from typing import Optional, List
@@ -9,8 +9,8 @@ class TaskRepository:
     """Repositorio para operaciones de tareas."""
 
     @staticmethod
-    def create_task(
-        db: Session,
+    async def create_task(
+        db: AsyncSession,
         user_id: int,
         title: str,
         description: Optional[str] = None,
@@ -30,28 +30,31 @@ class TaskRepository:
             recurrence_rule=recurrence_rule,
         )
         db.add(task)
-        db.commit()
-        db.refresh(task)
+        await db.commit()
+        await db.refresh(task)
         return task
 
     @staticmethod
-    def get_task_by_id(db: Session, task_id: int, user_id: int) -> Optional[Task]:
+    async def get_task_by_id(
+        db: AsyncSession, task_id: int, user_id: int
+    ) -> Optional[Task]:
         """Obtener tarea por ID (solo si pertenece al usuario)."""
-        return (
-            db.query(Task)
-            .filter(
+        result = await db.execute(
+            select(Task).where(
                 and_(
                     Task.id == task_id,
                     Task.user_id == user_id,
                     Task.deleted_at.is_(None),
                 )
             )
-            .first()
+            # Recargar aunque ya esté en la sesión (p. ej. tras cambiar categorías)
+            .execution_options(populate_existing=True)
         )
+        return result.scalars().first()
 
     @staticmethod
-    def get_tasks_by_user(
-        db: Session,
+    async def get_tasks_by_user(
+        db: AsyncSession,
         user_id: int,
         status: Optional[str] = None,
         priority: Optional[str] = None,
@@ -66,25 +69,25 @@ class TaskRepository:
         offset: int = 0,
     ) -> List[Task]:
         """Obtener todas las tareas del usuario con filtros avanzados."""
-        query = db.query(Task).filter(Task.user_id == user_id)
+        query = select(Task).where(Task.user_id == user_id)
 
         if not include_deleted:
-            query = query.filter(Task.deleted_at.is_(None))
+            query = query.where(Task.deleted_at.is_(None))
 
         # Filtro por estatus
         if status:
-            query = query.filter(Task.status == status)
+            query = query.where(Task.status == status)
 
         # Filtro por prioridad
         if priority:
-            query = query.filter(Task.priority == priority)
+            query = query.where(Task.priority == priority)
 
         # Filtro por categoría (single)
         if category_id:
             query = (
                 query.join(TaskCategory)
                 .join(Category)
-                .filter(
+                .where(
                     TaskCategory.category_id == category_id, Category.user_id == user_id
                 )
             )
@@ -92,50 +95,42 @@ class TaskRepository:
         # Filtro por múltiples categorías (AND)
         if category_ids:
             for cat_id in category_ids:
+                task_category = TaskCategory.__table__.alias()
                 query = query.join(
-                    TaskCategory, TaskCategory.task_id == Task.id
-                ).filter(TaskCategory.category_id == cat_id)
+                    task_category, task_category.c.task_id == Task.id
+                ).where(task_category.c.category_id == cat_id)
 
         # Filtro por rango de fecha de vencimiento
         if deadline_from:
-            query = query.filter(Task.deadline >= deadline_from)
+            query = query.where(Task.deadline >= deadline_from)
 
         if deadline_to:
-            query = query.filter(Task.deadline <= deadline_to)
+            query = query.where(Task.deadline <= deadline_to)
 
         # Búsqueda por texto (título o descripción)
         if search:
             search_term = f"%{search}%"
-            query = query.filter(
+            query = query.where(
                 or_(Task.title.ilike(search_term), Task.description.ilike(search_term))
             )
 
         # Filtro por completado
         if completed is not None:
             if completed:
-                query = query.filter(Task.status == "completada")
+                query = query.where(Task.status == "completada")
             else:
-                query = query.filter(Task.status != "completada")
+                query = query.where(Task.status != "completada")
 
         # Aplicar límite y offset
-        return query.limit(limit).offset(offset).all()
+        result = await db.execute(query.limit(limit).offset(offset))
+        return list(result.scalars().all())
 
     @staticmethod
-    def update_task(
-        db: Session, task_id: int, user_id: int, **kwargs
+    async def update_task(
+        db: AsyncSession, task_id: int, user_id: int, **kwargs
     ) -> Optional[Task]:
         """Actualizar tarea (optimistic locking)."""
-        task = (
-            db.query(Task)
-            .filter(
-                and_(
-                    Task.id == task_id,
-                    Task.user_id == user_id,
-                    Task.deleted_at.is_(None),
-                )
-            )
-            .first()
-        )
+        task = await TaskRepository.get_task_by_id(db, task_id, user_id)
 
         if not task:
             return None
@@ -155,24 +150,16 @@ class TaskRepository:
         task.version += 1
         task.updated_at = datetime.utcnow()
 
-        db.commit()
-        db.refresh(task)
+        await db.commit()
+        await db.refresh(task)
         return task
 
     @staticmethod
-    def soft_delete_task(db: Session, task_id: int, user_id: int) -> Optional[Task]:
+    async def soft_delete_task(
+        db: AsyncSession, task_id: int, user_id: int
+    ) -> Optional[Task]:
         """Soft delete de tarea."""
-        task = (
-            db.query(Task)
-            .filter(
-                and_(
-                    Task.id == task_id,
-                    Task.user_id == user_id,
-                    Task.deleted_at.is_(None),
-                )
-            )
-            .first()
-        )
+        task = await TaskRepository.get_task_by_id(db, task_id, user_id)
 
         if not task:
             return None
@@ -181,24 +168,25 @@ class TaskRepository:
         task.version += 1
         task.updated_at = datetime.utcnow()
 
-        db.commit()
-        db.refresh(task)
+        await db.commit()
+        await db.refresh(task)
         return task
 
     @staticmethod
-    def restore_task(db: Session, task_id: int, user_id: int) -> Optional[Task]:
+    async def restore_task(
+        db: AsyncSession, task_id: int, user_id: int
+    ) -> Optional[Task]:
         """Restaurar tarea eliminada."""
-        task = (
-            db.query(Task)
-            .filter(
+        result = await db.execute(
+            select(Task).where(
                 and_(
                     Task.id == task_id,
                     Task.user_id == user_id,
                     Task.deleted_at.isnot(None),
                 )
             )
-            .first()
         )
+        task = result.scalars().first()
 
         if not task:
             return None
@@ -207,24 +195,16 @@ class TaskRepository:
         task.version += 1
         task.updated_at = datetime.utcnow()
 
-        db.commit()
-        db.refresh(task)
+        await db.commit()
+        await db.refresh(task)
         return task
 
     @staticmethod
-    def complete_task(db: Session, task_id: int, user_id: int) -> Optional[Task]:
+    async def complete_task(
+        db: AsyncSession, task_id: int, user_id: int
+    ) -> Optional[Task]:
         """Marcar tarea como completada."""
-        task = (
-            db.query(Task)
-            .filter(
-                and_(
-                    Task.id == task_id,
-                    Task.user_id == user_id,
-                    Task.deleted_at.is_(None),
-                )
-            )
-            .first()
-        )
+        task = await TaskRepository.get_task_by_id(db, task_id, user_id)
 
         if not task:
             return None
@@ -234,86 +214,102 @@ class TaskRepository:
         task.version += 1
         task.updated_at = datetime.utcnow()
 
-        db.commit()
-        db.refresh(task)
+        await db.commit()
+        await db.refresh(task)
         return task
 
     @staticmethod
-    def batch_complete_tasks(db: Session, task_ids: List[int], user_id: int) -> int:
+    async def get_user_task_ids(
+        db: AsyncSession, task_ids: List[int], user_id: int
+    ) -> List[int]:
+        """Filtrar los IDs que existen y pertenecen al usuario."""
+        result = await db.execute(
+            select(Task.id).where(and_(Task.id.in_(task_ids), Task.user_id == user_id))
+        )
+        return list(result.scalars().all())
+
+    @staticmethod
+    async def batch_complete_tasks(
+        db: AsyncSession, task_ids: List[int], user_id: int
+    ) -> int:
         """Marcar múltiples tareas como completadas."""
-        updated = (
-            db.query(Task)
-            .filter(
+        result = await db.execute(
+            update(Task)
+            .where(
                 and_(
                     Task.id.in_(task_ids),
                     Task.user_id == user_id,
                     Task.deleted_at.is_(None),
                 )
             )
-            .update(
+            .values(
                 {
                     Task.status: "completada",
                     Task.completed_at: datetime.utcnow(),
                     Task.version: Task.version + 1,
                     Task.updated_at: datetime.utcnow(),
-                },
-                synchronize_session=False,
+                }
             )
+            .execution_options(synchronize_session=False)
         )
-        db.commit()
-        return updated
+        await db.commit()
+        return result.rowcount
 
     @staticmethod
-    def batch_delete_tasks(db: Session, task_ids: List[int], user_id: int) -> int:
+    async def batch_delete_tasks(
+        db: AsyncSession, task_ids: List[int], user_id: int
+    ) -> int:
         """Soft delete de múltiples tareas."""
-        updated = (
-            db.query(Task)
-            .filter(
+        result = await db.execute(
+            update(Task)
+            .where(
                 and_(
                     Task.id.in_(task_ids),
                     Task.user_id == user_id,
                     Task.deleted_at.is_(None),
                 )
             )
-            .update(
+            .values(
                 {
                     Task.deleted_at: datetime.utcnow(),
                     Task.version: Task.version + 1,
                     Task.updated_at: datetime.utcnow(),
-                },
-                synchronize_session=False,
+                }
             )
+            .execution_options(synchronize_session=False)
         )
-        db.commit()
-        return updated
+        await db.commit()
+        return result.rowcount
 
     @staticmethod
-    def batch_restore_tasks(db: Session, task_ids: List[int], user_id: int) -> int:
+    async def batch_restore_tasks(
+        db: AsyncSession, task_ids: List[int], user_id: int
+    ) -> int:
         """Restaurar múltiples tareas eliminadas."""
-        updated = (
-            db.query(Task)
-            .filter(
+        result = await db.execute(
+            update(Task)
+            .where(
                 and_(
                     Task.id.in_(task_ids),
                     Task.user_id == user_id,
                     Task.deleted_at.isnot(None),
                 )
             )
-            .update(
+            .values(
                 {
                     Task.deleted_at: None,
                     Task.version: Task.version + 1,
                     Task.updated_at: datetime.utcnow(),
-                },
-                synchronize_session=False,
+                }
             )
+            .execution_options(synchronize_session=False)
         )
-        db.commit()
-        return updated
+        await db.commit()
+        return result.rowcount
 
     @staticmethod
-    def batch_update_tasks(
-        db: Session, task_ids: List[int], user_id: int, **update_fields
+    async def batch_update_tasks(
+        db: AsyncSession, task_ids: List[int], user_id: int, **update_fields
     ) -> int:
         """Actualizar múltiples tareas."""
         update_data = {}
@@ -325,30 +321,31 @@ class TaskRepository:
             return 0
 
         # Agregar timestamp de actualización
-        update_data[Task.version] = Task.version + 1
-        update_data[Task.updated_at] = datetime.utcnow()
+        update_data["version"] = Task.version + 1
+        update_data["updated_at"] = datetime.utcnow()
 
-        updated = (
-            db.query(Task)
-            .filter(
+        result = await db.execute(
+            update(Task)
+            .where(
                 and_(
                     Task.id.in_(task_ids),
                     Task.user_id == user_id,
                     Task.deleted_at.is_(None),
                 )
             )
-            .update(update_data, synchronize_session=False)
+            .values(update_data)
+            .execution_options(synchronize_session=False)
         )
-        db.commit()
-        return updated
+        await db.commit()
+        return result.rowcount
 
 
 class TaskEventRepository:
     """Repositorio para eventos de auditoría de tareas."""
 
     @staticmethod
-    def create_event(
-        db: Session,
+    async def create_event(
+        db: AsyncSession,
         task_id: int,
         user_id: int,
         event_type: str,
@@ -366,26 +363,31 @@ class TaskEventRepository:
             payload=payload,
         )
         db.add(event)
-        db.commit()
-        db.refresh(event)
+        await db.commit()
+        await db.refresh(event)
         return event
 
     @staticmethod
-    def get_task_events(db: Session, task_id: int) -> List[TaskEvent]:
+    async def get_task_events(db: AsyncSession, task_id: int) -> List[TaskEvent]:
         """Obtener todos los eventos de una tarea."""
-        return db.query(TaskEvent).filter(TaskEvent.task_id == task_id).all()
+        result = await db.execute(select(TaskEvent).where(TaskEvent.task_id == task_id))
+        return list(result.scalars().all())
 
     @staticmethod
-    def get_task_events_paginated(
-        db: Session, task_id: int, limit: int = 100, offset: int = 0
+    async def get_task_events_paginated(
+        db: AsyncSession, task_id: int, limit: int = 100, offset: int = 0
     ) -> tuple[List[TaskEvent], int]:
         """Obtener eventos de una tarea con paginación."""
-        query = db.query(TaskEvent).filter(TaskEvent.task_id == task_id)
-        total = query.count()
-        events = (
-            query.order_by(TaskEvent.created_at.desc())
+        total = await db.scalar(
+            select(func.count())
+            .select_from(TaskEvent)
+            .where(TaskEvent.task_id == task_id)
+        )
+        result = await db.execute(
+            select(TaskEvent)
+            .where(TaskEvent.task_id == task_id)
+            .order_by(TaskEvent.created_at.desc())
             .limit(limit)
             .offset(offset)
-            .all()
         )
-        return events, total
+        return list(result.scalars().all()), total
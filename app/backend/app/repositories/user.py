@@ -1,4 +1,6 @@
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.concurrency import run_in_threadpool
 from app.models.user import User
 from app.core.security import hash_password
 from typing import Optional
@@ -8,26 +10,31 @@ class UserRepository:
     """Repositorio para operaciones de usuario."""
 
     @staticmethod
-    def create_user(db: Session, username: str, email: str, password: str) -> User:
+    async def create_user(
+        db: AsyncSession, username: str, email: str, password: str
+    ) -> User:
         """Crear nuevo usuario."""
-        hashed_password = hash_password(password)
+        # bcrypt es CPU-bound: fuera del event loop
+        hashed_password = await run_in_threadpool(hash_password, password)
         user = User(username=username, email=email, password_hash=hashed_password)
         db.add(user)
-        db.commit()
-        db.refresh(user)
+        await db.commit()
+        await db.refresh(user)
         return user
 
     @staticmethod
-    def get_user_by_email(db: Session, email: str) -> Optional[User]:
+    async def get_user_by_email(db: AsyncSession, email: str) -> Optional[User]:
         """Obtener usuario por email."""
-        return db.query(User).filter(User.email == email).first()
+        result = await db.execute(select(User).where(User.email == email))
+        return result.scalars().first()
 
     @staticmethod
-    def get_user_by_username(db: Session, username: str) -> Optional[User]:
+    async def get_user_by_username(db: AsyncSession, username: str) -> Optional[User]:
         """Obtener usuario por username."""
-        return db.query(User).filter(User.username == username).first()
+        result = await db.execute(select(User).where(User.username == username))
+        return result.scalars().first()
 
     @staticmethod
-    def get_user_by_id(db: Session, user_id: int) -> Optional[User]:
+    async def get_user_by_id(db: AsyncSession, user_id: int) -> Optional[User]:
         """Obtener usuario por ID."""
-        return db.query(User).filter(User.id == user_id).first()
+        return await db.get(User, user_id)
@@ -1,6 +1,6 @@
 from fastapi import APIRouter, Depends, HTTPException, status, Request
 from fastapi.responses import JSONResponse
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from datetime import datetime
 from app.core.database import get_db
 from app.core.security import verify_token
@@ -20,10 +20,10 @@ router = APIRouter(
 @router.post(
     "/register", response_model=APIResponse, status_code=status.HTTP_201_CREATED
 )
-def register(request: UserRegisterRequest, db: Session = Depends(get_db)):
+async def register(request: UserRegisterRequest, db: AsyncSession = Depends(get_db)):
     """Registrar nuevo usuario con validaciones backend."""
     try:
-        user = AuthService.register_user(
+        user = await AuthService.register_user(
             db, request.username, request.email, request.password
         )
         return APIResponse(
@@ -44,9 +44,9 @@ def register(request: UserRegisterRequest, db: Session = Depends(get_db)):
 
 
 @router.post("/login", response_model=APIResponse)
-def login(request: UserLoginRequest, db: Session = Depends(get_db)):
+async def login(request: UserLoginRequest, db: AsyncSession = Depends(get_db)):
     """Autenticar usuario con tokens segmentados."""
-    result = AuthService.authenticate_user(db, request.email, request.password)
+    result = await AuthService.authenticate_user(db, request.email, request.password)
 
     if not result:
         raise HTTPException(
@@ -82,7 +82,7 @@ def login(request: UserLoginRequest, db: Session = Depends(get_db)):
 
 
 @router.post("/refresh", response_model=APIResponse)
-def refresh(request: Request, db: Session = Depends(get_db)):
+async def refresh(request: Request, db: AsyncSession = Depends(get_db)):
     """Refrescar access token usando refresh token de cookie."""
 
     # Obtener refresh token de la cookie
@@ -122,7 +122,7 @@ def refresh(request: Request, db: Session = Depends(get_db)):
 
 
 @router.post("/logout", response_model=APIResponse)
-def logout():
+async def logout():
     """Cerrar sesión e invalidar refresh token."""
     response = JSONResponse(
         content=APIResponse(
@@ -136,7 +136,7 @@ def logout():
 
 
 @router.get("/me", response_model=APIResponse)
-def get_current_user(request: Request, db: Session = Depends(get_db)):
+async def get_current_user(request: Request, db: AsyncSession = Depends(get_db)):
     """Obtener usuario actual autenticado."""
 
     # Obtener usuario del token
@@ -164,7 +164,7 @@ def get_current_user(request: Request, db: Session = Depends(get_db)):
         )
 
     user_id = int(payload.get("sub"))
-    user = AuthService.get_user_from_token(db, user_id)
+    user = await AuthService.get_user_from_token(db, user_id)
 
     if not user:
         raise HTTPException(
@@ -1,5 +1,5 @@
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from datetime import datetime
 from app.core.database import get_db
 from app.core.dependencies import get_current_user
@@ -18,14 +18,14 @@ router = APIRouter(
 
 
 @router.post("", response_model=APIResponse, status_code=status.HTTP_201_CREATED)
-def create_category(
+async def create_category(
     request: CategoryCreateRequest,
     current_user: UserResponse = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ):
     """Crear nueva categoría."""
     try:
-        category = CategoryService.create_category(
+        category = await CategoryService.create_category(
             db=db, user_id=current_user.id, name=request.name, color=request.color
         )
 
@@ -42,13 +42,13 @@ def create_category(
 
 
 @router.get("/{category_id}", response_model=APIResponse)
-def get_category(
+async def get_category(
     category_id: int,
     current_user: UserResponse = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ):
     """Obtener categoría específica."""
-    category = CategoryService.get_category(db, category_id, current_user.id)
+    category = await CategoryService.get_category(db, category_id, current_user.id)
 
     if not category:
         raise HTTPException(
@@ -61,12 +61,12 @@ def get_category(
 
 
 @router.get("", response_model=APIResponse)
-def list_categories(
+async def list_categories(
     current_user: UserResponse = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ):
     """Obtener todas las categorías del usuario."""
-    categories = CategoryService.get_user_categories(db, current_user.id)
+    categories = await CategoryService.get_user_categories(db, current_user.id)
 
     return APIResponse(
         status="success",
@@ -79,15 +79,15 @@ def list_categories(
 
 
 @router.put("/{category_id}", response_model=APIResponse)
-def update_category(
+async def update_category(
     category_id: int,
     request: CategoryUpdateRequest,
     current_user: UserResponse = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ):
     """Actualizar categoría."""
     try:
-        category = CategoryService.update_category(
+        category = await CategoryService.update_category(
             db=db,
             category_id=category_id,
             user_id=current_user.id,
@@ -108,13 +108,13 @@ def update_category(
 
 
 @router.delete("/{category_id}", response_model=APIResponse)
-def delete_category(
+async def delete_category(
     category_id: int,
     current_user: UserResponse = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ):
     """Eliminar categoría."""
-    success = CategoryService.delete_category(db, category_id, current_user.id)
+    success = await CategoryService.delete_category(db, category_id, current_user.id)
 
     if not success:
         raise HTTPException(
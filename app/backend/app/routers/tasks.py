@@ -1,5 +1,5 @@
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from datetime import datetime
 from app.core.database import get_db
 from app.core.dependencies import get_current_user
@@ -22,14 +22,14 @@ router = APIRouter(
 
 
 @router.post("", response_model=APIResponse, status_code=status.HTTP_201_CREATED)
-def create_task(
+async def create_task(
     request: TaskCreateRequest,
     current_user: UserResponse = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ):
     """Crear nueva tarea con idempotencia."""
     try:
-        task = TaskService.create_task(
+        task = await TaskService.create_task(
             db=db,
             user_id=current_user.id,
             title=request.title,
@@ -43,14 +43,14 @@ def create_task(
         # Agregar categorías si se especificaron
         if request.category_ids:
             for category_id in request.category_ids:
-                TaskService.add_category_to_task(
+                await TaskService.add_category_to_task(
                     db=db,
                     task_id=task.id,
                     user_id=current_user.id,
                     category_id=category_id,
                 )
             # Refrescar la tarea para incluir las categorías
-            task = TaskService.get_task(db, task.id, current_user.id)
+            task = await TaskService.get_task(db, task.id, current_user.id)
 
         return APIResponse(
             status="success", data={"task": task}, timestamp=datetime.utcnow()
@@ -65,13 +65,13 @@ def create_task(
 
 
 @router.get("/{task_id}", response_model=APIResponse)
-def get_task(
+async def get_task(
     task_id: int,
     current_user: UserResponse = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ):
     """Obtener tarea específica."""
-    task = TaskService.get_task(db, task_id, current_user.id)
+    task = await TaskService.get_task(db, task_id, current_user.id)
 
     if not task:
         raise HTTPException(
@@ -84,7 +84,7 @@ def get_task(
 
 
 @router.get("", response_model=APIResponse)
-def list_tasks(
+async def list_tasks(
     status: str = None,
     priority: str = None,
     category_id: int = None,
@@ -97,7 +97,7 @@ def list_tasks(
     limit: int = 1000,
     offset: int = 0,
     current_user: UserResponse = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ):
     """Obtener todas las tareas del usuario con filtros avanzados."""
     # Parsear múltiples categorías (comma-separated list)
@@ -111,7 +111,7 @@ def list_tasks(
                 detail="Invalid category IDs format",
             )
 
-    tasks = TaskService.get_user_tasks(
+    tasks = await TaskService.get_user_tasks(
         db=db,
         user_id=current_user.id,
         status=status,
@@ -138,15 +138,15 @@ def list_tasks(
 
 
 @router.put("/{task_id}", response_model=APIResponse)
-def update_task(
+async def update_task(
     task_id: int,
     request: TaskUpdateRequest,
     current_user: UserResponse = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ):
     """Actualizar tarea con optimistic locking."""
     try:
-        task = TaskService.update_task(
+        task = await TaskService.update_task(
             db=db,
             task_id=task_id,
             user_id=current_user.id,
@@ -174,15 +174,15 @@ def update_task(
 
 
 @router.patch("/{task_id}", response_model=APIResponse)
-def patch_task(
+async def patch_task(
     task_id: int,
     request: TaskUpdateRequest,
     current_user: UserResponse = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ):
     """Actualizar tarea parcialmente con optimistic locking."""
     try:
-        task = TaskService.update_task(
+        task = await TaskService.update_task(
             db=db,
             task_id=task_id,
             user_id=current_user.id,
@@ -202,14 +202,14 @@ def patch_task(
 
         # Actualizar categorías si se especificaron
         if request.category_ids is not None:
-            TaskService.sync_task_categories(
+            await TaskService.sync_task_categories(
                 db=db,
                 task_id=task_id,
                 user_id=current_user.id,
                 category_ids=request.category_ids,
             )
             # Refrescar la tarea para incluir las categorías actualizadas
-            task = TaskService.get_task(db, task_id, current_user.id)
+            task = await TaskService.get_task(db, task_id, current_user.id)
 
         return APIResponse(
             status="success", data={"task": task}, timestamp=datetime.utcnow()
@@ -221,13 +221,13 @@ def patch_task(
 
 
 @router.delete("/{task_id}", response_model=APIResponse)
-def delete_task(
+async def delete_task(
     task_id: int,
     current_user: UserResponse = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ):
     """Soft delete de tarea."""
-    task = TaskService.delete_task(db, task_id, current_user.id)
+    task = await TaskService.delete_task(db, task_id, current_user.id)
 
     if not task:
         raise HTTPException(
@@ -240,13 +240,13 @@ def delete_task(
 
 
 @router.patch("/{task_id}/restore", response_model=APIResponse)
-def restore_task(
+async def restore_task(
     task_id: int,
     current_user: UserResponse = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ):
     """Restaurar tarea eliminada."""
-    task = TaskService.restore_task(db, task_id, current_user.id)
+    task = await TaskService.restore_task(db, task_id, current_user.id)
 
     if not task:
         raise HTTPException(
@@ -259,13 +259,13 @@ def restore_task(
 
 
 @router.patch("/{task_id}/complete", response_model=APIResponse)
-def complete_task(
+async def complete_task(
     task_id: int,
     current_user: UserResponse = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ):
     """Marcar tarea como completada."""
-    task = TaskService.complete_task(db, task_id, current_user.id)
+    task = await TaskService.complete_task(db, task_id, current_user.id)
 
     if not task:
         raise HTTPException(
@@ -282,14 +282,14 @@ def complete_task(
     response_model=APIResponse,
     status_code=status.HTTP_201_CREATED,
 )
-def add_category_to_task(
+async def add_category_to_task(
     task_id: int,
     request: TaskCategoryRequest,
     current_user: UserResponse = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ):
     """Agregar categoría a tarea."""
-    success = TaskService.add_category_to_task(
+    success = await TaskService.add_category_to_task(
         db=db, task_id=task_id, user_id=current_user.id, category_id=request.category_id
     )
 
@@ -307,14 +307,14 @@ def add_category_to_task(
 
 
 @router.delete("/{task_id}/categories/{category_id}", response_model=APIResponse)
-def remove_category_from_task(
+async def remove_category_from_task(
     task_id: int,
     category_id: int,
     current_user: UserResponse = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ):
     """Remover categoría de tarea."""
-    success = TaskService.remove_category_from_task(
+    success = await TaskService.remove_category_from_task(
         db=db, task_id=task_id, user_id=current_user.id, category_id=category_id
     )
 
@@ -332,13 +332,13 @@ def remove_category_from_task(
 
 
 @router.post("/batch/complete", response_model=APIResponse)
-def batch_complete_tasks(
+async def batch_complete_tasks(
     request: BatchTaskRequest,
     current_user: UserResponse = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ):
     """Completar múltiples tareas."""
-    result = TaskService.batch_complete_tasks(
+    result = await TaskService.batch_complete_tasks(
         db=db, task_ids=request.task_ids, user_id=current_user.id
     )
 
@@ -346,13 +346,13 @@ def batch_complete_tasks(
 
 
 @router.post("/batch/delete", response_model=APIResponse)
-def batch_delete_tasks(
+async def batch_delete_tasks(
     request: BatchTaskRequest,
     current_user: UserResponse = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ):
     """Eliminar múltiples tareas (soft delete)."""
-    result = TaskService.batch_delete_tasks(
+    result = await TaskService.batch_delete_tasks(
         db=db, task_ids=request.task_ids, user_id=current_user.id
     )
 
@@ -360,13 +360,13 @@ def batch_delete_tasks(
 
 
 @router.post("/batch/restore", response_model=APIResponse)
-def batch_restore_tasks(
+async def batch_restore_tasks(
     request: BatchTaskRequest,
     current_user: UserResponse = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ):
     """Restaurar múltiples tareas eliminadas."""
-    result = TaskService.batch_restore_tasks(
+    result = await TaskService.batch_restore_tasks(
         db=db, task_ids=request.task_ids, user_id=current_user.id
     )
 
@@ -374,13 +374,13 @@ def batch_restore_tasks(
 
 
 @router.patch("/batch/update", response_model=APIResponse)
-def batch_update_tasks(
+async def batch_update_tasks(
     request: BatchUpdateTaskRequest,
     current_user: UserResponse = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ):
     """Actualizar múltiples tareas."""
-    result = TaskService.batch_update_tasks(
+    result = await TaskService.batch_update_tasks(
         db=db,
         task_ids=request.task_ids,
         user_id=current_user.id,
@@ -392,16 +392,16 @@ def batch_update_tasks(
 
 
 @router.get("/{task_id}/events", response_model=APIResponse)
-def get_task_events(
+async def get_task_events(
     task_id: int,
     limit: int = 100,
     offset: int = 0,
     current_user: UserResponse = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ):
     """Obtener historial de eventos (auditoría) de una tarea."""
     # Verificar que la tarea pertenece al usuario
-    task = TaskService.get_task(db, task_id, current_user.id)
+    task = await TaskService.get_task(db, task_id, current_user.id)
     if not task:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Tarea no encontrada"
@@ -410,7 +410,7 @@ def get_task_events(
     # Obtener eventos
     from app.repositories.task import TaskEventRepository
 
-    events, total = TaskEventRepository.get_task_events_paginated(
+    events, total = await TaskEventRepository.get_task_events_paginated(
         db, task_id, limit=limit, offset=offset
     )
 
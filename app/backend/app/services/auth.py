@@ -1,4 +1,5 @@
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.concurrency import run_in_threadpool
 from app.repositories.user import UserRepository
 from app.core.security import verify_password, create_access_token, create_refresh_token
 from app.schemas.user import UserResponse
@@ -9,27 +10,31 @@ class AuthService:
     """Servicio de autenticación."""
 
     @staticmethod
-    def register_user(
-        db: Session, username: str, email: str, password: str
+    async def register_user(
+        db: AsyncSession, username: str, email: str, password: str
     ) -> UserResponse:
         """Registrar nuevo usuario."""
         # Verificar que el usuario no exista
-        if UserRepository.get_user_by_email(db, email):
+        if await UserRepository.get_user_by_email(db, email):
             raise ValueError("Email ya registrado")
 
-        if UserRepository.get_user_by_username(db, username):
+        if await UserRepository.get_user_by_username(db, username):
             raise ValueError("Username ya utilizado")
 
         # Crear usuario
-        user = UserRepository.create_user(db, username, email, password)
+        user = await UserRepository.create_user(db, username, email, password)
         return UserResponse.model_validate(user)
 
     @staticmethod
-    def authenticate_user(db: Session, email: str, password: str) -> Optional[Tuple]:
+    async def authenticate_user(
+        db: AsyncSession, email: str, password: str
+    ) -> Optional[Tuple]:
         """Autenticar usuario y retornar tokens."""
-        user = UserRepository.get_user_by_email(db, email)
+        user = await UserRepository.get_user_by_email(db, email)
 
-        if not user or not verify_password(password, user.password_hash):
+        if not user or not await run_in_threadpool(
+            verify_password, password, user.password_hash
+        ):
             return None
 
         # Crear tokens
@@ -39,9 +44,11 @@ class AuthService:
         return access_token, refresh_token, UserResponse.model_validate(user)
 
     @staticmethod
-    def get_user_from_token(db: Session, user_id: int) -> Optional[UserResponse]:
+    async def get_user_from_token(
+        db: AsyncSession, user_id: int
+    ) -> Optional[UserResponse]:
         """Obtener usuario del ID en token."""
-        user = UserRepository.get_user_by_id(db, user_id)
+        user = await UserRepository.get_user_by_id(db, user_id)
         if user:
             return UserResponse.model_validate(user)
         return None
@@ -1,5 +1,5 @@
-from sqlalchemy.orm import Session
-from sqlalchemy import and_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import and_, delete, select
 from app.models.task import IdempotencyKey
 from datetime import datetime, timedelta
 from typing import Optional
@@ -11,21 +11,20 @@ class IdempotencyService:
     """Servicio para gestionar claves de idempotencia."""
 
     @staticmethod
-    def get_cached_response(
-        db: Session, user_id: int, idempotency_key: str
+    async def get_cached_response(
+        db: AsyncSession, user_id: int, idempotency_key: str
     ) -> Optional[dict]:
         """Obtener respuesta cacheada si existe."""
-        cached = (
-            db.query(IdempotencyKey)
-            .filter(
+        result = await db.execute(
+            select(IdempotencyKey).where(
                 and_(
                     IdempotencyKey.user_id == user_id,
                     IdempotencyKey.idempotency_key == idempotency_key,
                     IdempotencyKey.expires_at > datetime.utcnow(),
                 )
             )
-            .first()
         )
+        cached = result.scalars().first()
 
         if cached and cached.response_data:
             return {
@@ -36,8 +35,8 @@ class IdempotencyService:
         return None
 
     @staticmethod
-    def cache_response(
-        db: Session,
+    async def cache_response(
+        db: AsyncSession,
         user_id: int,
         idempotency_key: str,
         request_hash: str,
@@ -49,12 +48,14 @@ class IdempotencyService:
         expires_at = datetime.utcnow() + timedelta(minutes=ttl_minutes)
 
         # Limpiar claves expiradas del mismo usuario
-        db.query(IdempotencyKey).filter(
-            and_(
-                IdempotencyKey.user_id == user_id,
-                IdempotencyKey.expires_at <= datetime.utcnow(),
+        await db.execute(
+            delete(IdempotencyKey).where(
+                and_(
+                    IdempotencyKey.user_id == user_id,
+                    IdempotencyKey.expires_at <= datetime.utcnow(),
+                )
             )
-        ).delete()
+        )
 
         # Crear nueva entrada
         cached = IdempotencyKey(
@@ -67,8 +68,8 @@ class IdempotencyService:
         )
 
         db.add(cached)
-        db.commit()
-        db.refresh(cached)
+        await db.commit()
+        await db.refresh(cached)
 
         return cached
 
@@ -1,4 +1,4 @@
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from app.repositories.task import TaskRepository, TaskEventRepository
 from app.repositories.category import CategoryRepository, TaskCategoryRepository
 from app.schemas.task import TaskResponse
@@ -9,8 +9,8 @@ class TaskService:
     """Servicio de lógica de negocio para tareas."""
 
     @staticmethod
-    def create_task(
-        db: Session,
+    async def create_task(
+        db: AsyncSession,
         user_id: int,
         title: str,
         description: Optional[str] = None,
@@ -21,7 +21,7 @@ class TaskService:
     ) -> TaskResponse:
         """Crear nueva tarea y registrar evento."""
         # Crear tarea
-        task = TaskRepository.create_task(
+        task = await TaskRepository.create_task(
             db=db,
             user_id=user_id,
             title=title,
@@ -33,7 +33,7 @@ class TaskService:
         )
 
         # Registrar evento de auditoría
-        TaskEventRepository.create_event(
+        await TaskEventRepository.create_event(
             db=db,
             task_id=task.id,
             user_id=user_id,
@@ -49,16 +49,18 @@ class TaskService:
         return TaskResponse.from_orm(task)
 
     @staticmethod
-    def get_task(db: Session, task_id: int, user_id: int) -> Optional[TaskResponse]:
+    async def get_task(
+        db: AsyncSession, task_id: int, user_id: int
+    ) -> Optional[TaskResponse]:
         """Obtener una tarea específica."""
-        task = TaskRepository.get_task_by_id(db, task_id, user_id)
+        task = await TaskRepository.get_task_by_id(db, task_id, user_id)
         if task:
             return TaskResponse.from_orm(task)
         return None
 
     @staticmethod
-    def get_user_tasks(
-        db: Session,
+    async def get_user_tasks(
+        db: AsyncSession,
         user_id: int,
         status: Optional[str] = None,
         priority: Optional[str] = None,
@@ -73,7 +75,7 @@ class TaskService:
         offset: int = 0,
     ) -> List[TaskResponse]:
         """Obtener todas las tareas del usuario con filtros avanzados."""
-        tasks = TaskRepository.get_tasks_by_user(
+        tasks = await TaskRepository.get_tasks_by_user(
             db=db,
             user_id=user_id,
             status=status,
@@ -91,8 +93,8 @@ class TaskService:
         return [TaskResponse.from_orm(task) for task in tasks]
 
     @staticmethod
-    def update_task(
-        db: Session,
+    async def update_task(
+        db: AsyncSession,
         task_id: int,
         user_id: int,
         title: Optional[str] = None,
@@ -105,7 +107,7 @@ class TaskService:
     ) -> Optional[TaskResponse]:
         """Actualizar tarea con optimistic locking."""
         # Obtener tarea actual
-        task = TaskRepository.get_task_by_id(db, task_id, user_id)
+        task = await TaskRepository.get_task_by_id(db, task_id, user_id)
         if not task:
             return None
 
@@ -138,7 +140,9 @@ class TaskService:
             update_data["version"] = version
 
         # Actualizar
-        updated_task = TaskRepository.update_task(db, task_id, user_id, **update_data)
+        updated_task = await TaskRepository.update_task(
+            db, task_id, user_id, **update_data
+        )
 
         # Registrar evento
         new_state = {
@@ -148,7 +152,7 @@ class TaskService:
             "deadline": str(updated_task.deadline) if updated_task.deadline else None,
         }
 
-        TaskEventRepository.create_event(
+        await TaskEventRepository.create_event(
             db=db,
             task_id=task_id,
             user_id=user_id,
@@ -160,60 +164,64 @@ class TaskService:
         return TaskResponse.from_orm(updated_task)
 
     @staticmethod
-    def delete_task(db: Session, task_id: int, user_id: int) -> Optional[TaskResponse]:
+    async def delete_task(
+        db: AsyncSession, task_id: int, user_id: int
+    ) -> Optional[TaskResponse]:
         """Soft delete de tarea."""
-        task = TaskRepository.soft_delete_task(db, task_id, user_id)
+        task = await TaskRepository.soft_delete_task(db, task_id, user_id)
         if task:
-            TaskEventRepository.create_event(
+            await TaskEventRepository.create_event(
                 db=db, task_id=task_id, user_id=user_id, event_type="task_deleted"
             )
             return TaskResponse.from_orm(task)
         return None
 
     @staticmethod
-    def restore_task(db: Session, task_id: int, user_id: int) -> Optional[TaskResponse]:
+    async def restore_task(
+        db: AsyncSession, task_id: int, user_id: int
+    ) -> Optional[TaskResponse]:
         """Restaurar tarea eliminada."""
-        task = TaskRepository.restore_task(db, task_id, user_id)
+        task = await TaskRepository.restore_task(db, task_id, user_id)
         if task:
-            TaskEventRepository.create_event(
+            await TaskEventRepository.create_event(
                 db=db, task_id=task_id, user_id=user_id, event_type="task_restored"
             )
             return TaskResponse.from_orm(task)
         return None
 
     @staticmethod
-    def complete_task(
-        db: Session, task_id: int, user_id: int
+    async def complete_task(
+        db: AsyncSession, task_id: int, user_id: int
     ) -> Optional[TaskResponse]:
         """Marcar tarea como completada."""
-        task = TaskRepository.complete_task(db, task_id, user_id)
+        task = await TaskRepository.complete_task(db, task_id, user_id)
         if task:
-            TaskEventRepository.create_event(
+            await TaskEventRepository.create_event(
                 db=db, task_id=task_id, user_id=user_id, event_type="task_completed"
             )
             return TaskResponse.from_orm(task)
         return None
 
     @staticmethod
-    def add_category_to_task(
-        db: Session, task_id: int, user_id: int, category_id: int
+    async def add_category_to_task(
+        db: AsyncSession, task_id: int, user_id: int, category_id: int
     ) -> bool:
         """Agregar categoría a tarea (validar que el usuario posea la tarea y categoría)."""
         # Verificar que la tarea pertenece al usuario
-        task = TaskRepository.get_task_by_id(db, task_id, user_id)
+        task = await TaskRepository.get_task_by_id(db, task_id, user_id)
         if not task:
             return False
 
         # Verificar que la categoría pertenece al usuario
-        category = CategoryRepository.get_category_by_id(db, category_id, user_id)
+        category = await CategoryRepository.get_category_by_id(db, category_id, user_id)
         if not category:
             return False
 
         # Agregar la relación
-        TaskCategoryRepository.add_category_to_task(db, task_id, category_id)
+        await TaskCategoryRepository.add_category_to_task(db, task_id, category_id)
 
         # Registrar evento
-        TaskEventRepository.create_event(
+        await TaskEventRepository.create_event(
             db=db,
             task_id=task_id,
             user_id=user_id,
@@ -224,23 +232,23 @@ class TaskService:
         return True
 
     @staticmethod
-    def remove_category_from_task(
-        db: Session, task_id: int, user_id: int, category_id: int
+    async def remove_category_from_task(
+        db: AsyncSession, task_id: int, user_id: int, category_id: int
     ) -> bool:
         """Remover categoría de tarea (validar que el usuario posea la tarea)."""
         # Verificar que la tarea pertenece al usuario
-        task = TaskRepository.get_task_by_id(db, task_id, user_id)
+        task = await TaskRepository.get_task_by_id(db, task_id, user_id)
         if not task:
             return False
 
         # Remover la relación
-        success = TaskCategoryRepository.remove_category_from_task(
+        success = await TaskCategoryRepository.remove_category_from_task(
             db, task_id, category_id
         )
 
         if success:
             # Registrar evento
-            TaskEventRepository.create_event(
+            await TaskEventRepository.create_event(
                 db=db,
                 task_id=task_id,
                 user_id=user_id,
@@ -251,33 +259,35 @@ class TaskService:
         return success
 
     @staticmethod
-    def sync_task_categories(
-        db: Session, task_id: int, user_id: int, category_ids: List[int]
+    async def sync_task_categories(
+        db: AsyncSession, task_id: int, user_id: int, category_ids: List[int]
     ) -> bool:
         """Sincronizar categorías de una tarea (reemplaza todas las categorías existentes)."""
         # Verificar que la tarea pertenece al usuario
-        task = TaskRepository.get_task_by_id(db, task_id, user_id)
+        task = await TaskRepository.get_task_by_id(db, task_id, user_id)
         if not task:
             return False
 
         # Obtener categorías actuales
-        current_categories = TaskCategoryRepository.get_task_categories(db, task_id)
+        current_categories = await TaskCategoryRepository.get_task_categories(
+            db, task_id
+        )
         current_category_ids = {cat.id for cat in current_categories}
         new_category_ids = set(category_ids)
 
         # Remover categorías que ya no están
         for cat_id in current_category_ids - new_category_ids:
-            TaskCategoryRepository.remove_category_from_task(db, task_id, cat_id)
+            await TaskCategoryRepository.remove_category_from_task(db, task_id, cat_id)
 
         # Agregar nuevas categorías
         for cat_id in new_category_ids - current_category_ids:
             # Verificar que la categoría pertenece al usuario
-            category = CategoryRepository.get_category_by_id(db, cat_id, user_id)
+            category = await CategoryRepository.get_category_by_id(db, cat_id, user_id)
             if category:
-                TaskCategoryRepository.add_category_to_task(db, task_id, cat_id)
+                await TaskCategoryRepository.add_category_to_task(db, task_id, cat_id)
 
         # Registrar evento
-        TaskEventRepository.create_event(
+        await TaskEventRepository.create_event(
             db=db,
             task_id=task_id,
             user_id=user_id,
@@ -288,47 +298,53 @@ class TaskService:
         return True
 
     @staticmethod
-    def batch_complete_tasks(db: Session, task_ids: List[int], user_id: int) -> dict:
+    async def batch_complete_tasks(
+        db: AsyncSession, task_ids: List[int], user_id: int
+    ) -> dict:
         """Marcar múltiples tareas como completadas."""
-        updated_count = TaskRepository.batch_complete_tasks(db, task_ids, user_id)
+        updated_count = await TaskRepository.batch_complete_tasks(db, task_ids, user_id)
 
-        # Registrar evento para cada tarea
-        for task_id in task_ids:
-            TaskEventRepository.create_event(
+        # Registrar evento para cada tarea del usuario
+        for task_id in await TaskRepository.get_user_task_ids(db, task_ids, user_id):
+            await TaskEventRepository.create_event(
                 db=db, task_id=task_id, user_id=user_id, event_type="task_completed"
             )
 
         return {"updated": updated_count, "total_requested": len(task_ids)}
 
     @staticmethod
-    def batch_delete_tasks(db: Session, task_ids: List[int], user_id: int) -> dict:
+    async def batch_delete_tasks(
+        db: AsyncSession, task_ids: List[int], user_id: int
+    ) -> dict:
         """Soft delete de múltiples tareas."""
-        updated_count = TaskRepository.batch_delete_tasks(db, task_ids, user_id)
+        updated_count = await TaskRepository.batch_delete_tasks(db, task_ids, user_id)
 
-        # Registrar evento para cada tarea
-        for task_id in task_ids:
-            TaskEventRepository.create_event(
+        # Registrar evento para cada tarea del usuario
+        for task_id in await TaskRepository.get_user_task_ids(db, task_ids, user_id):
+            await TaskEventRepository.create_event(
                 db=db, task_id=task_id, user_id=user_id, event_type="task_deleted"
             )
 
         return {"updated": updated_count, "total_requested": len(task_ids)}
 
     @staticmethod
-    def batch_restore_tasks(db: Session, task_ids: List[int], user_id: int) -> dict:
+    async def batch_restore_tasks(
+        db: AsyncSession, task_ids: List[int], user_id: int
+    ) -> dict:
         """Restaurar múltiples tareas eliminadas."""
-        updated_count = TaskRepository.batch_restore_tasks(db, task_ids, user_id)
+        updated_count = await TaskRepository.batch_restore_tasks(db, task_ids, user_id)
 
-        # Registrar evento para cada tarea
-        for task_id in task_ids:
-            TaskEventRepository.create_event(
+        # Registrar evento para cada tarea del usuario
+        for task_id in await TaskRepository.get_user_task_ids(db, task_ids, user_id):
+            await TaskEventRepository.create_event(
                 db=db, task_id=task_id, user_id=user_id, event_type="task_restored"
             )
 
         return {"updated": updated_count, "total_requested": len(task_ids)}
 
     @staticmethod
-    def batch_update_tasks(
-        db: Session,
+    async def batch_update_tasks(
+        db: AsyncSession,
         task_ids: List[int],
         user_id: int,
         status: Optional[str] = None,
@@ -341,13 +357,13 @@ class TaskService:
         if priority:
             update_kwargs["priority"] = priority
 
-        updated_count = TaskRepository.batch_update_tasks(
+        updated_count = await TaskRepository.batch_update_tasks(
             db, task_ids, user_id, **update_kwargs
         )
 
-        # Registrar evento para cada tarea
-        for task_id in task_ids:
-            TaskEventRepository.create_event(
+        # Registrar evento para cada tarea del usuario
+        for task_id in await TaskRepository.get_user_task_ids(db, task_ids, user_id):
+            await TaskEventRepository.create_event(
                 db=db,
                 task_id=task_id,
                 user_id=user_id,
@@ -4,35 +4,42 @@ Pytest configuration and fixtures for test isolation.
 This module provides fixtures to ensure test isolation by cleaning
 the database between tests.
 """
+import asyncio
+
 import pytest
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.pool import StaticPool
 
 from app.main import app
-from app.core.database import Base, get_db
+from app.core.database import Base, get_db, configure_sqlite_engine
 
 
 # Create in-memory database for testing
-SQLALCHEMY_TEST_DATABASE_URL = "sqlite:///:memory:"
+SQLALCHEMY_TEST_DATABASE_URL = "sqlite+aiosqlite:///:memory:"
 
-engine = create_engine(
-    SQLALCHEMY_TEST_DATABASE_URL,
-    connect_args={"check_same_thread": False},
-    poolclass=StaticPool,
+engine = configure_sqlite_engine(
+    create_async_engine(
+        SQLALCHEMY_TEST_DATABASE_URL,
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
 )
 
-TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+TestingSessionLocal = async_sessionmaker(
+    bind=engine, autoflush=False, expire_on_commit=False
+)
 
 
-def override_get_db():
+async def override_get_db():
     """Override the get_db dependency for testing."""
-    try:
-        db = TestingSessionLocal()
+    async with TestingSessionLocal() as db:
         yield db
-    finally:
-        db.close()
+
+
+async def _run_schema(action):
+    async with engine.begin() as conn:
+        await conn.run_sync(action)
 
 
 @pytest.fixture(scope="function", autouse=True)
@@ -45,12 +52,12 @@ def setup_database():
     Using autouse=True means it applies automatically to all tests.
     """
     # Create all tables
-    Base.metadata.create_all(bind=engine)
+    asyncio.run(_run_schema(Base.metadata.create_all))
 
     yield
 
     # Drop all tables after the test
-    Base.metadata.drop_all(bind=engine)
+    asyncio.run(_run_schema(Base.metadata.drop_all))
 
 
 @pytest.fixture(scope="function")
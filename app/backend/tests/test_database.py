@@ -0,0 +1,52 @@
+"""Tests for SQLite connection setup (PRAGMA profiles)."""
+import pytest
+from sqlalchemy import create_engine, text
+
+from app.core.database import (
+    configure_sqlite_engine,
+    get_sqlite_profile,
+    read_sqlite_pragmas,
+)
+
+
+def test_performance_profile_applied_on_connect(tmp_path):
+    """El perfil performance se aplica a cada conexión del pool."""
+    engine = configure_sqlite_engine(
+        create_engine(f"sqlite:///{tmp_path / 'perf.db'}"), "performance"
+    )
+
+    with engine.connect() as conn:
+        pragmas = read_sqlite_pragmas(conn, get_sqlite_profile("performance"))
+
+    assert pragmas["journal_mode"] == "wal"
+    assert pragmas["synchronous"] == 1  # NORMAL
+    assert pragmas["temp_store"] == 2  # MEMORY
+    assert pragmas["foreign_keys"] == 1
+    assert pragmas["busy_timeout"] == get_sqlite_profile("performance")["busy_timeout"]
+
+
+def test_durable_profile_uses_full_sync(tmp_path):
+    """El perfil durable hace fsync en cada commit."""
+    engine = configure_sqlite_engine(
+        create_engine(f"sqlite:///{tmp_path / 'durable.db'}"), "durable"
+    )
+
+    with engine.connect() as conn:
+        assert conn.execute(text("PRAGMA synchronous")).scalar() == 2  # FULL
+
+
+def test_unknown_profile_raises():
+    """Un perfil desconocido es un error de configuración."""
+    with pytest.raises(ValueError):
+        get_sqlite_profile("turbo")
+
+
+def test_ready_reports_sqlite_profile(client):
+    """/ready expone el perfil activo y sus valores efectivos."""
+    response = client.get("/ready")
+
+    assert response.status_code == 200
+    checks = response.json()["checks"]
+    assert checks["database"] == "ok"
+    assert checks["sqlite_profile"]["name"] == "performance"
+    assert checks["sqlite_profile"]["pragmas"]["foreign_keys"] == 1